@@ -5,11 +5,56 @@ Creates diverse test scenarios to validate AI learning capabilities
 """
 
 import json
+import logging
 import random
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Error types and patterns
+ERROR_TYPES = (
+    "build_failure",
+    "test_failure",
+    "deployment_failure",
+    "dependency_issue",
+    "configuration_error",
+    "syntax_error",
+    "environment_issue",
+    "resource_conflict",
+    "timeout_error",
+    "permission_denied",
+)
+
+# Success patterns
+FIX_PATTERNS = (
+    "dependency_update",
+    "config_correction",
+    "syntax_fix",
+    "environment_setup",
+    "permission_fix",
+    "timeout_increase",
+    "resource_allocation",
+    "cache_clear",
+    "rebuild_clean",
+    "tool_upgrade",
+)
+
+# Realistic failure contexts for generated scenarios
+CONTEXTS = (
+    "Swift compilation error in main view controller",
+    "iOS deployment target mismatch",
+    "Xcode build configuration issue",
+    "CocoaPods dependency conflict",
+    "macOS notarization failure",
+    "Unit test timeout in CI environment",
+    "GitHub Actions workflow permission issue",
+    "Memory leak in release build",
+    "App Store Connect upload failure",
+    "Code signing certificate expired",
+)
+
 
 class AILearningTestGenerator:
     def __init__(self, base_dir="/Users/danielstevens/Desktop/Code"):
@@ -25,43 +70,17 @@ class AILearningTestGenerator:
         """Generate diverse test scenarios for AI learning validation"""
         scenarios = []
 
-        # Error types and patterns
-        error_types = [
-            "build_failure",
-            "test_failure",
-            "deployment_failure",
-            "dependency_issue",
-            "configuration_error",
-            "syntax_error",
-            "environment_issue",
-            "resource_conflict",
-            "timeout_error",
-            "permission_denied",
-        ]
-
-        # Success patterns
-        fix_patterns = [
-            "dependency_update",
-            "config_correction",
-            "syntax_fix",
-            "environment_setup",
-            "permission_fix",
-            "timeout_increase",
-            "resource_allocation",
-            "cache_clear",
-            "rebuild_clean",
-            "tool_upgrade",
-        ]
+        # One clock read per batch so every test_id shares the same stamp
+        now = datetime.now()
+        batch_stamp = now.strftime("%Y%m%d_%H%M%S")
 
         for i in range(count):
             scenario = {
-                "test_id": f"scenario_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{i:03d}",
-                "timestamp": (
-                    datetime.now() - timedelta(hours=random.randint(1, 72))
-                ).isoformat(),
+                "test_id": f"scenario_{batch_stamp}_{i:03d}",
+                "timestamp": (now - timedelta(hours=random.randint(1, 72))).isoformat(),
                 "project": random.choice(self.projects),
-                "error_type": random.choice(error_types),
-                "fix_pattern": random.choice(fix_patterns),
+                "error_type": random.choice(ERROR_TYPES),
+                "fix_pattern": random.choice(FIX_PATTERNS),
                 "success_rate": random.uniform(0.6, 1.0),
                 "complexity_score": random.randint(1, 10),
                 "learning_weight": random.uniform(0.1, 1.0),
@@ -74,21 +93,10 @@ class AILearningTestGenerator:
 
         return scenarios
 
-    def _generate_context(self):
+    @staticmethod
+    def _generate_context():
         """Generate realistic context for test scenarios"""
-        contexts = [
-            "Swift compilation error in main view controller",
-            "iOS deployment target mismatch",
-            "Xcode build configuration issue",
-            "CocoaPods dependency conflict",
-            "macOS notarization failure",
-            "Unit test timeout in CI environment",
-            "GitHub Actions workflow permission issue",
-            "Memory leak in release build",
-            "App Store Connect upload failure",
-            "Code signing certificate expired",
-        ]
-        return random.choice(contexts)
+        return random.choice(CONTEXTS)
 
     def create_learning_data(self, project_name, scenario_count=5):
         """Create learning data for a specific project"""
@@ -149,7 +157,7 @@ class AILearningTestGenerator:
             with open(pattern_file, "w", encoding="utf-8") as f:
                 json.dump(pattern_correlation, f, indent=2)
 
-        print(f"✅ Generated {len(scenarios)} test scenarios for {project_name}")
+        logger.info(f"✅ Generated {len(scenarios)} test scenarios for {project_name}")
         return scenarios
 
     def validate_learning_effectiveness(self, project_name):
@@ -158,56 +166,57 @@ class AILearningTestGenerator:
         learning_dir = project_path / ".ai_learning_system"
 
         if not learning_dir.exists():
-            print(f"❌ Learning directory not found for {project_name}")
+            logger.warning(f"❌ Learning directory not found for {project_name}")
             return False
 
         # Count learning files
         fix_files = list(learning_dir.glob("fix_history_*.json"))
-        pattern_files = list(learning_dir.glob("pattern_correlation_*.json"))
+        pattern_count = sum(1 for _ in learning_dir.glob("pattern_correlation_*.json"))
 
-        print(f"📊 {project_name} Learning Data:")
-        print(f"   - Fix history files: {len(fix_files)}")
-        print(f"   - Pattern correlation files: {len(pattern_files)}")
+        logger.info(f"📊 {project_name} Learning Data:")
+        logger.info(f"   - Fix history files: {len(fix_files)}")
+        logger.info(f"   - Pattern correlation files: {pattern_count}")
 
         # Sample analysis of learning data
         if fix_files:
             with open(fix_files[0], encoding="utf-8") as f:
                 sample_fix = json.load(f)
-            print(f"   - Sample fix type: {sample_fix['error_pattern']['type']}")
-            print(
+            logger.info(f"   - Sample fix type: {sample_fix['error_pattern']['type']}")
+            logger.info(
                 f"   - Sample success rate: {sample_fix['solution_pattern']['success_rate']:.2%}"
             )
 
-        return len(fix_files) > 0 and len(pattern_files) > 0
+        return len(fix_files) > 0 and pattern_count > 0
 
     def generate_comprehensive_test_suite(self):
         """Generate comprehensive test suite for all projects"""
-        print("🧪 Generating Comprehensive AI Learning Test Suite")
-        print("=" * 60)
+        logger.info("🧪 Generating Comprehensive AI Learning Test Suite")
+        logger.info("=" * 60)
 
         total_scenarios = 0
 
         for project in self.projects:
-            print(f"\n🔍 Processing {project}...")
+            logger.info(f"🔍 Processing {project}...")
             scenarios = self.create_learning_data(project, scenario_count=8)
             total_scenarios += len(scenarios)
 
             # Validate learning data
             if self.validate_learning_effectiveness(project):
-                print(f"✅ {project} validation successful")
+                logger.info(f"✅ {project} validation successful")
             else:
-                print(f"❌ {project} validation failed")
+                logger.warning(f"❌ {project} validation failed")
 
-        print("\n📈 Test Suite Summary:")
-        print(f"   - Total scenarios generated: {total_scenarios}")
-        print(f"   - Projects tested: {len(self.projects)}")
-        print("   - Expected learning improvements: Immediate")
+        logger.info("📈 Test Suite Summary:")
+        logger.info(f"   - Total scenarios generated: {total_scenarios}")
+        logger.info(f"   - Projects tested: {len(self.projects)}")
+        logger.info("   - Expected learning improvements: Immediate")
 
         return total_scenarios
 
 
 def main():
     """Main execution function"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     generator = AILearningTestGenerator()
 
     if len(sys.argv) > 1:
@@ -222,11 +231,11 @@ def main():
             count = int(sys.argv[2]) if len(sys.argv) > 2 else 10
             scenarios = generator.generate_test_scenarios(count)
             for scenario in scenarios:
-                print(
+                logger.info(
                     f"📋 {scenario['test_id']}: {scenario['error_type']} → {scenario['fix_pattern']}"
                 )
         else:
-            print("❌ Unknown command. Use: generate, validate, or scenarios")
+            logger.error("❌ Unknown command. Use: generate, validate, or scenarios")
     else:
         # Default: generate comprehensive test suite
         generator.generate_comprehensive_test_suite()
@@ -29,16 +29,19 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("ai_workflow_recovery.log"), logging.StreamHandler()],
-)
 logger = logging.getLogger(__name__)
 
+# Fixed patterns, compiled once at import
+_GITHUB_REMOTE_RE = re.compile(r"github\.com[:/]([^/]+)/([^/]+)")
+_TRACEBACK_LOCATION_RE = re.compile(r'File "([^"]+)", line (\d+)')
+_LINT_LOCATION_RE = re.compile(r"([^:]+):(\d+):")
+_FLAKE8_F401_RE = re.compile(
+    r"([^:]+):(\d+):(\d+): F401 \'([^\']+)\' imported but unused"
+)
+_MISSING_FILE_RE = re.compile(r'No such file or directory: [\'"]*([^\'"]+)[\'"]*')
+
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowFailure:
     """Represents a workflow failure with analysis data"""
 
@@ -55,7 +58,7 @@ class WorkflowFailure:
     retry_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AILearningPattern:
     """AI learning pattern for failure analysis"""
 
@@ -73,8 +76,7 @@ class AIWorkflowRecovery:
     def __init__(self, repo_path: str, github_token: str = None):
         self.repo_path = Path(repo_path)
         self.github_token = github_token or os.getenv("GITHUB_TOKEN")
-        self.owner = self._get_repo_owner()
-        self.repo_name = self._get_repo_name()
+        self.owner, self.repo_name = self._parse_remote_url()
 
         # Configuration
         self.max_retries = 5
@@ -97,8 +99,9 @@ class AIWorkflowRecovery:
             f"🤖 AI Workflow Recovery initialized for {self.owner}/{self.repo_name}"
         )
 
-    def _get_repo_owner(self) -> str:
-        """Extract repository owner from git config"""
+    def _parse_remote_url(self) -> tuple[str, str]:
+        """Extract repository owner and name from git config"""
+        owner, repo = "unknown", "unknown"
         try:
             result = subprocess.run(
                 ["git", "config", "--get", "remote.origin.url"],
@@ -108,31 +111,15 @@ class AIWorkflowRecovery:
                 check=False,
             )
             url = result.stdout.strip()
-            # Extract owner from GitHub URL
-            match = re.search(r"github\.com[:/]([^/]+)/([^/]+)", url)
-            return match.group(1) if match else "unknown"
-        except Exception:  # pylint: disable=broad-exception-caught
-            return "unknown"
-
-    def _get_repo_name(self) -> str:
-        """Extract repository name from git config"""
-        try:
-            result = subprocess.run(
-                ["git", "config", "--get", "remote.origin.url"],
-                capture_output=True,
-                text=True,
-                cwd=self.repo_path,
-                check=False,
-            )
-            url = result.stdout.strip()
-            # Extract repo name from GitHub URL
-            match = re.search(r"github\.com[:/]([^/]+)/([^/]+)", url)
+            # Extract owner and repo name from GitHub URL
+            match = _GITHUB_REMOTE_RE.search(url)
             if match:
-                repo = match.group(2)
-                return repo.replace(".git", "")
-            return "unknown"
+                owner = match.group(1)
+                repo = match.group(2).replace(".git", "")
         except Exception:  # pylint: disable=broad-exception-caught
-            return "unknown"
+            pass
+
+        return owner, repo
 
     def _load_learning_patterns(self) -> list[AILearningPattern]:
         """Load AI learning patterns from storage"""
@@ -201,8 +188,12 @@ class AIWorkflowRecovery:
             "updated": datetime.now().isoformat(),
         }
 
-        with open(patterns_file, "w", encoding="utf-8") as f:
+        # Write to a sibling temp file and swap it in, so an interrupted save
+        # never leaves a truncated patterns file behind
+        tmp_file = patterns_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_file, patterns_file)
 
     def analyze_workflow_failure(self, log_content: str) -> WorkflowFailure | None:
         """Use AI to analyze workflow failure and suggest fixes"""
@@ -244,11 +235,12 @@ class AIWorkflowRecovery:
         logger.warning("❓ No matching pattern found for failure")
         return None
 
-    def _extract_error_message(self, log_content: str, pattern: str) -> str:
+    @staticmethod
+    def _extract_error_message(log_content: str, pattern: str) -> str:
         """Extract specific error message from logs"""
-        lines = log_content.split("\n")
-        for line in lines:
-            if re.search(pattern, line, re.IGNORECASE):
+        rx = re.compile(pattern, re.IGNORECASE)
+        for line in log_content.split("\n"):
+            if rx.search(line):
                 return line.strip()
         return "Error message not found"
 
@@ -278,9 +270,9 @@ class AIWorkflowRecovery:
         logger.info("🐍 Fixing Python syntax errors...")
 
         # Extract file and line from error
-        match = re.search(r'File "([^"]+)", line (\d+)', failure.error_message)
+        match = _TRACEBACK_LOCATION_RE.search(failure.error_message)
         if not match:
-            match = re.search(r"([^:]+):(\d+):", failure.error_message)
+            match = _LINT_LOCATION_RE.search(failure.error_message)
 
         if match:
             file_path = self.repo_path / match.group(1).lstrip("./")
@@ -327,37 +319,45 @@ class AIWorkflowRecovery:
         if result.returncode == 0 and not result.stdout:
             return True
 
-        # Parse flake8 output and fix unused imports
+        # Parse flake8 output, grouping unused imports by file
+        unused_by_file: dict[Path, list[tuple[int, str]]] = {}
         for line in result.stdout.split("\n"):
             if "F401" in line:
-                match = re.match(
-                    r"([^:]+):(\d+):(\d+): F401 \'([^\']+)\' imported but unused", line
-                )
+                match = _FLAKE8_F401_RE.match(line)
                 if match:
                     file_path = self.repo_path / match.group(1)
-                    line_num = int(match.group(2))
-                    import_name = match.group(4)
-
-                    # Remove unused import
-                    if file_path.exists():
-                        with open(file_path, encoding="utf-8") as f:
-                            lines = f.readlines()
-
-                        if line_num <= len(lines):
-                            import_line = lines[line_num - 1]
-                            # Remove the import if it's a simple single import
-                            if (
-                                f"import {import_name}" in import_line
-                                or f'from {import_name.split(".")[0]}' in import_line
-                            ):
-                                lines[line_num - 1] = ""  # Remove the line
-
-                                with open(file_path, "w", encoding="utf-8") as f:
-                                    f.writelines(lines)
-
-                                logger.info(
-                                    f"✅ Removed unused import: {import_name} from {file_path}"
-                                )
+                    unused_by_file.setdefault(file_path, []).append(
+                        (int(match.group(2)), match.group(4))
+                    )
+
+        # Remove unused imports, reading and rewriting each file only once
+        for file_path, unused in unused_by_file.items():
+            if not file_path.exists():
+                continue
+
+            with open(file_path, encoding="utf-8") as f:
+                lines = f.readlines()
+
+            removed = []
+            for line_num, import_name in unused:
+                if line_num <= len(lines):
+                    import_line = lines[line_num - 1]
+                    # Remove the import if it's a simple single import
+                    if (
+                        f"import {import_name}" in import_line
+                        or f'from {import_name.split(".")[0]}' in import_line
+                    ):
+                        lines[line_num - 1] = ""  # Remove the line
+                        removed.append(import_name)
+
+            if removed:
+                with open(file_path, "w", encoding="utf-8") as f:
+                    f.writelines(lines)
+
+                for import_name in removed:
+                    logger.info(
+                        f"✅ Removed unused import: {import_name} from {file_path}"
+                    )
 
         return True
 
@@ -366,9 +366,7 @@ class AIWorkflowRecovery:
         logger.info("📄 Creating missing files...")
 
         # Extract filename from error
-        match = re.search(
-            r'No such file or directory: [\'"]*([^\'"]+)[\'"]*', failure.error_message
-        )
+        match = _MISSING_FILE_RE.search(failure.error_message)
         if match:
             missing_file = match.group(1)
             file_path = self.repo_path / missing_file
@@ -553,10 +551,10 @@ Timestamp: {datetime.now().isoformat()}"""
             failure.retry_count = iteration
 
             # Safety check: same error repeatedly
-            same_errors = [
-                f for f in self.failure_history if f.error_type == failure.error_type
-            ]
-            if len(same_errors) >= self.safety_checks["max_same_error_retries"]:
+            same_errors = sum(
+                1 for f in self.failure_history if f.error_type == failure.error_type
+            )
+            if same_errors >= self.safety_checks["max_same_error_retries"]:
                 logger.warning(
                     f"🛑 Too many attempts for {failure.error_type}, stopping"
                 )
@@ -577,7 +575,7 @@ Timestamp: {datetime.now().isoformat()}"""
                     for pattern in self.patterns:
                         if pattern.pattern_id == failure.error_type:
                             pattern.usage_count += 1
-                            pattern.last_used = datetime.now()
+                            pattern.last_used = failure.fix_timestamp
                             break
 
                     # Wait for CI/CD to process
@@ -610,6 +608,18 @@ Timestamp: {datetime.now().isoformat()}"""
         return False
 
 
+def _configure_logging():
+    """Attach console and file handlers; deferred so importing has no side effects"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler("ai_workflow_recovery.log"),
+            logging.StreamHandler(),
+        ],
+    )
+
+
 def main():
     """Main entry point for AI Workflow Recovery"""
     import argparse
@@ -626,6 +636,7 @@ def main():
     )
 
     args = parser.parse_args()
+    _configure_logging()
 
     # Initialize recovery system
     recovery = AIWorkflowRecovery(args.repo_path)